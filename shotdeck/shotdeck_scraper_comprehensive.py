@@ -17,12 +17,12 @@ How it works:
 1. Paginates through /browse/searchstillsajax to find shots with data-clip='1'
 2. Triggers video generation by calling /browse/viewclip endpoint
 3. Downloads the generated video from the CDN
-4. Fetches metadata from /browse/shotdetailsajax
+4. Fetches metadata from /browse/shotdetailsajax (concurrently with step 3)
 5. Groups all videos by inferred title and saves to JSON
 
 Requirements:
 - Python 3.10+
-- requests, beautifulsoup4
+- requests, lxml, orjson, selectolax
 - ShotDeck account with valid session cookie
 
 Usage:
@@ -30,14 +30,24 @@ Usage:
 """
 
 import requests
-import json
+import orjson
 import os
+import functools
 import time
+import threading
 import re
+import shutil
+import sqlite3
+import multiprocessing
 from datetime import datetime
-from collections import defaultdict
-from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict, deque
+from lxml import etree
+from selectolax.lexbor import LexborHTMLParser
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
 
 
 # =============================================================================
@@ -51,12 +61,20 @@ VIDEO_DIR = os.path.join(OUTPUT_DIR, "videos")
 
 # API settings
 API_SHOTS_PER_PAGE = 36  # ShotDeck returns ~36 shots per page
-API_PAGE_DELAY = 0.3     # Seconds between API page requests
+API_PAGE_DELAY = 0.3     # Average seconds between API page requests
+API_PAGE_BURST = 4       # API page requests allowed back to back
+API_STREAM_CHUNK_SIZE = 16 * 1024  # Bytes fed to the search page parser at a time
 ONLY_WITH_CLIPS = True   # Only retrieve shots that have video clips
 
 # Rate limiting
-METADATA_DELAY = 0.5     # Seconds between metadata requests
+METADATA_DELAY = 0.5     # Average seconds between metadata requests
+METADATA_BURST = 8       # Metadata requests allowed back to back
+METADATA_WORKERS = 4     # Parallel metadata requests
+# Processes parsing metadata pages; no more than the pages that can be in flight
+PARSE_WORKERS = min(os.cpu_count() or 1, METADATA_WORKERS)
+METADATA_CACHE_COMMIT_EVERY = 100  # Cached metadata rows written per commit
 VIDEO_DOWNLOAD_WORKERS = 3  # Parallel video downloads
+DOWNLOAD_CHUNK_SIZE = 256 * 1024  # Bytes copied per read when saving videos
 
 # URLs
 VIDEO_BASE_URL = "https://crunch.shotdeck.com/assets/images/clips"
@@ -81,10 +99,106 @@ HEADERS = {
 }
 
 
+# =============================================================================
+# RATE LIMITING
+# =============================================================================
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    
+    Allows bursts of up to `capacity` requests and refills at `rate` tokens
+    per second, so throughput is capped on average rather than by a fixed
+    sleep after every request.
+    """
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.condition = threading.Condition()
+    
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        with self.condition:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                self.condition.wait((1 - self.tokens) / self.rate)
+
+
+API_PAGE_BUCKET = TokenBucket(rate=1 / API_PAGE_DELAY, capacity=API_PAGE_BURST)
+META_BUCKET = TokenBucket(rate=1 / METADATA_DELAY, capacity=METADATA_BURST)
+
+
 # =============================================================================
 # API SHOT DISCOVERY
 # =============================================================================
 
+TOTAL_SHOTS_RE = re.compile(rb'totalShots\s*=\s*(\d+)')
+
+
+def stream_search_page(response: requests.Response, find_total: bool = False) -> tuple[list[tuple[str, bool]], int | None]:
+    """
+    Parse a streamed search page as it arrives.
+    
+    Feeds the response body to an lxml pull parser chunk by chunk and
+    collects each outerimage tile as soon as it closes, releasing parsed
+    elements along the way. If find_total is set, the raw bytes are also
+    scanned for the totalShots count.
+    
+    Returns:
+        Tuple of (list of (shot ID, has clip) tiles, total shots or None)
+    """
+    parser = etree.HTMLPullParser(events=('end',), tag='div')
+    tiles = []
+    total_shots = None
+    tail = b''
+    
+    def collect_tiles():
+        for _, elem in parser.read_events():
+            if 'outerimage' in (elem.get('class') or '').split():
+                tiles.append((elem.get('data-shotid'), elem.get('data-clip') == '1'))
+            # Empty the finished div and detach the siblings before it, so the
+            # tree doesn't keep growing with every tile
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    
+    for chunk in response.iter_content(chunk_size=API_STREAM_CHUNK_SIZE):
+        if find_total and total_shots is None:
+            # Carry a short tail so a count split across chunks is still found
+            window = tail + chunk
+            match = TOTAL_SHOTS_RE.search(window)
+            if match and match.end() < len(window):
+                total_shots = int(match.group(1))
+            else:
+                tail = window[-64:]
+        
+        parser.feed(chunk)
+        collect_tiles()
+    
+    if find_total and total_shots is None:
+        match = TOTAL_SHOTS_RE.search(tail)
+        if match:
+            total_shots = int(match.group(1))
+    
+    try:
+        parser.close()
+    except etree.XMLSyntaxError:
+        pass  # Empty page
+    collect_tiles()
+    
+    return tiles, total_shots
+
+
 def scrape_api_shots(session: requests.Session, limit: int = None) -> tuple[list[str], dict]:
     """
     Scrape shot IDs from ShotDeck's search API.
@@ -99,7 +213,7 @@ def scrape_api_shots(session: requests.Session, limit: int = None) -> tuple[list
     print(f"  Limit: {limit or 'None (all shots)'}")
     print(f"  Filter: Only shots with video clips")
     
-    all_shot_ids = []
+    all_shot_ids: dict[str, None] = {}  # Insertion-ordered set; pages can repeat shots
     shots_with_clips = 0
     shots_without_clips = 0
     total_shots = None
@@ -107,34 +221,28 @@ def scrape_api_shots(session: requests.Session, limit: int = None) -> tuple[list
     
     while True:
         url = f"{SEARCH_API_URL}/page/{page}"
+        API_PAGE_BUCKET.acquire()
         
         try:
-            response = session.get(url, headers={
+            with session.get(url, headers={
                 **HEADERS,
                 "X-Requested-With": "XMLHttpRequest"
-            }, timeout=30)
-            
-            if response.status_code != 200:
-                print(f"  HTTP {response.status_code} on page {page}, stopping.")
-                break
-            
-            html = response.text
+            }, timeout=30, stream=True) as response:
+                if response.status_code != 200:
+                    print(f"  HTTP {response.status_code} on page {page}, stopping.")
+                    break
+                
+                # Parse shot IDs while the page streams in; the total shots
+                # count only needs to be read from the first page
+                tiles, page_total = stream_search_page(response, find_total=total_shots is None)
             
-            # Extract total shots count on first page
-            if total_shots is None:
-                match = re.search(r'totalShots\s*=\s*(\d+)', html)
-                if match:
-                    total_shots = int(match.group(1))
-                    print(f"  Total shots in database: {total_shots:,}")
+            if page_total is not None:
+                total_shots = page_total
+                print(f"  Total shots in database: {total_shots:,}")
             
-            # Parse shot IDs from HTML
-            soup = BeautifulSoup(html, 'html.parser')
             page_shots = []
             
-            for div in soup.find_all('div', class_='outerimage'):
-                shot_id = div.get('data-shotid')
-                has_clip = div.get('data-clip') == '1'
-                
+            for shot_id, has_clip in tiles:
                 if shot_id:
                     if has_clip:
                         shots_with_clips += 1
@@ -149,7 +257,7 @@ def scrape_api_shots(session: requests.Session, limit: int = None) -> tuple[list
                 # No clips on this page, but continue searching
                 pass
             
-            all_shot_ids.extend(page_shots)
+            all_shot_ids.update(dict.fromkeys(page_shots))
             
             # Progress update every 50 pages
             if page % 50 == 0:
@@ -157,7 +265,6 @@ def scrape_api_shots(session: requests.Session, limit: int = None) -> tuple[list
             
             # Check limits
             if limit and len(all_shot_ids) >= limit:
-                all_shot_ids = all_shot_ids[:limit]
                 print(f"  Reached limit of {limit} shots")
                 break
             
@@ -165,30 +272,31 @@ def scrape_api_shots(session: requests.Session, limit: int = None) -> tuple[list
                 break
             
             # Check if page had no results
-            if not soup.find_all('div', class_='outerimage'):
+            if not tiles:
                 break
             
             page += 1
-            time.sleep(API_PAGE_DELAY)
             
         except requests.RequestException as e:
             print(f"  Error on page {page}: {e}")
             break
     
+    shot_ids = list(all_shot_ids)[:limit or None]
+    
     stats = {
         'total_in_database': total_shots,
         'pages_scraped': page,
         'shots_with_clips': shots_with_clips,
         'shots_without_clips': shots_without_clips,
-        'shots_collected': len(all_shot_ids),
+        'shots_collected': len(shot_ids),
     }
     
     print(f"\n  API Discovery Complete:")
     print(f"    Pages scraped: {page}")
     print(f"    Shots with video: {shots_with_clips}")
-    print(f"    Shots collected: {len(all_shot_ids)}")
+    print(f"    Shots collected: {len(shot_ids)}")
     
-    return all_shot_ids, stats
+    return shot_ids, stats
 
 
 # =============================================================================
@@ -210,9 +318,9 @@ def trigger_video_generation(shot_id: str, session: requests.Session) -> dict |
             "X-Requested-With": "XMLHttpRequest"
         }, timeout=30)
         
-        if response.status_code == 200 and response.text.strip():
+        if response.status_code == 200 and response.content.strip():
             try:
-                data = json.loads(response.text)
+                data = orjson.loads(response.content)
                 if isinstance(data, list) and len(data) >= 2:
                     return {
                         "filename": data[0],
@@ -220,7 +328,7 @@ def trigger_video_generation(shot_id: str, session: requests.Session) -> dict |
                         "framerate": data[2] if len(data) > 2 else None,
                         "type": data[3] if len(data) > 3 else None,
                     }
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 pass
         return None
     except requests.RequestException:
@@ -238,27 +346,56 @@ def download_video(shot_id: str, output_dir: str, session: requests.Session) ->
         size = os.path.getsize(filepath)
         return {"shot_id": shot_id, "path": filepath, "size_bytes": size, "status": "exists"}
     
+    # Clips already cached on the CDN don't need to be generated again. Only
+    # a 404 means the clip is missing; other errors are left to the download
+    url = f"{VIDEO_BASE_URL}/{shot_id}_clip.mp4"
+    try:
+        missing = session.head(url, timeout=10, allow_redirects=True).status_code == 404
+    except requests.RequestException:
+        missing = True  # Couldn't tell, so generate as before
+    
     # Trigger video generation
-    clip_info = trigger_video_generation(shot_id, session)
-    if clip_info:
-        url = clip_info.get("url", f"{VIDEO_BASE_URL}/{shot_id}_clip.mp4")
-        time.sleep(0.3)  # Brief delay for generation
-    else:
-        url = f"{VIDEO_BASE_URL}/{shot_id}_clip.mp4"
+    if missing:
+        clip_info = trigger_video_generation(shot_id, session)
+        if clip_info:
+            url = clip_info.get("url", url)
+            time.sleep(0.3)  # Brief delay for generation
     
     try:
-        response = requests.get(url, stream=True, timeout=120)
-        
-        if response.status_code == 200:
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+        # Close the streamed response so its connection goes back to the pool
+        with session.get(url, stream=True, timeout=120) as response:
+            if response.status_code != 200:
+                return {"shot_id": shot_id, "status": "failed", "error": f"HTTP {response.status_code}"}
             
-            size = os.path.getsize(filepath)
-            return {"shot_id": shot_id, "path": filepath, "size_bytes": size, "status": "downloaded"}
-        else:
-            return {"shot_id": shot_id, "status": "failed", "error": f"HTTP {response.status_code}"}
-    except requests.RequestException as e:
+            with open(filepath, 'wb') as f:
+                # Reserve the whole file up front so it isn't grown chunk by chunk.
+                # Encoded bodies are skipped: their length is measured before decoding
+                expected_size = 0
+                if 'Content-Encoding' not in response.headers:
+                    expected_size = int(response.headers.get('Content-Length') or 0)
+                if expected_size and hasattr(os, 'posix_fallocate'):
+                    try:
+                        os.posix_fallocate(f.fileno(), 0, expected_size)
+                    except OSError:
+                        pass
+                
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+                
+                # Older urllib3 doesn't enforce Content-Length, so a short body
+                # would leave the preallocated tail zero-filled
+                written = f.tell()
+                if expected_size and written != expected_size:
+                    raise requests.RequestException(
+                        f"Incomplete download: {written} of {expected_size} bytes"
+                    )
+        
+        size = os.path.getsize(filepath)
+        return {"shot_id": shot_id, "path": filepath, "size_bytes": size, "status": "downloaded"}
+    except (requests.RequestException, Urllib3HTTPError) as e:
+        # Don't leave a partial file behind to be mistaken for a finished download
+        if os.path.exists(filepath):
+            os.remove(filepath)
         return {"shot_id": shot_id, "status": "failed", "error": str(e)}
 
 
@@ -266,72 +403,99 @@ def download_video(shot_id: str, output_dir: str, session: requests.Session) ->
 # METADATA EXTRACTION
 # =============================================================================
 
-def parse_metadata_html(html: str, shot_id: str) -> dict:
+# Detail labels (lower-cased, without trailing colon) mapped to output fields
+FIELD_NAMES = {
+    'tag': 'tags', 'tags': 'tags',
+    'genre': 'genre', 'genres': 'genre',
+    'director': 'director', 'directors': 'director',
+    'cinematographer': 'cinematographer', 'dop': 'cinematographer', 'dp': 'cinematographer',
+    'production designer': 'production_designer',
+    'costume designer': 'costume_designer',
+    'editor': 'editor', 'editors': 'editor',
+    'colorist': 'colorist',
+    'color': 'color',
+    'actors': 'actors', 'actor': 'actors', 'cast': 'actors',
+    'time period': 'time_period',
+    'year': 'year',
+    'aspect ratio': 'aspect_ratio',
+    'format': 'format',
+    'frame size': 'frame_size',
+    'shot type': 'shot_type',
+    'lens size': 'lens_size',
+    'composition': 'composition',
+    'lighting': 'lighting',
+    'lighting type': 'lighting_type',
+    'time of day': 'time_of_day',
+    'interior/exterior': 'interior_exterior',
+    'location type': 'location_type',
+    'set': 'set',
+    'story location': 'story_location',
+    'filming location': 'filming_location',
+    'title': 'title', 'movie': 'title', 'film': 'title',
+    'music genre': 'music_genre',
+    'video genre': 'video_genre',
+    'stylist': 'stylist',
+    'production company': 'production_company',
+}
+
+# Fields that are always stored as lists
+LIST_FIELDS = frozenset({
+    'tags', 'genre', 'director', 'cinematographer', 'actors', 'color',
+    'shot_type', 'lens_size', 'composition', 'lighting', 'lighting_type',
+    'set', 'story_location', 'filming_location', 'editor', 'colorist',
+    'production_designer', 'costume_designer', 'music_genre', 'video_genre',
+    'stylist', 'production_company',
+})
+
+
+@functools.lru_cache(maxsize=256)
+def normalize_label(label: str) -> str:
+    """Normalize a detail label ("Director:" -> "director"); labels repeat across pages."""
+    return label.rstrip(':').lower()
+
+
+def response_html(response: requests.Response) -> bytes | str:
+    """
+    Return a page body in the form the parser should receive.
+    
+    Lexbor always decodes bytes as UTF-8, so raw bytes are only handed over
+    when the response is UTF-8; other charsets are decoded by requests.
+    """
+    if (response.encoding or '').lower().replace('_', '-') in ('utf-8', 'utf8'):
+        return response.content
+    return response.text
+
+
+def parse_metadata_html(html: bytes | str, shot_id: str) -> dict:
     """Parse metadata from ShotDeck's AJAX response."""
-    soup = BeautifulSoup(html, 'html.parser')
     metadata = {"shot_id": shot_id}
     
-    FIELD_NAMES = {
-        'tag': 'tags', 'tags': 'tags',
-        'genre': 'genre', 'genres': 'genre',
-        'director': 'director', 'directors': 'director',
-        'cinematographer': 'cinematographer', 'dop': 'cinematographer', 'dp': 'cinematographer',
-        'production designer': 'production_designer',
-        'costume designer': 'costume_designer',
-        'editor': 'editor', 'editors': 'editor',
-        'colorist': 'colorist',
-        'color': 'color',
-        'actors': 'actors', 'actor': 'actors', 'cast': 'actors',
-        'time period': 'time_period',
-        'year': 'year',
-        'aspect ratio': 'aspect_ratio',
-        'format': 'format',
-        'frame size': 'frame_size',
-        'shot type': 'shot_type',
-        'lens size': 'lens_size',
-        'composition': 'composition',
-        'lighting': 'lighting',
-        'lighting type': 'lighting_type',
-        'time of day': 'time_of_day',
-        'interior/exterior': 'interior_exterior',
-        'location type': 'location_type',
-        'set': 'set',
-        'story location': 'story_location',
-        'filming location': 'filming_location',
-        'title': 'title', 'movie': 'title', 'film': 'title',
-        'music genre': 'music_genre',
-        'video genre': 'video_genre',
-        'stylist': 'stylist',
-        'production company': 'production_company',
-    }
+    # A plain substring scan rules out pages with nothing to extract (e.g.
+    # login redirects) without building a tree
+    markers = (b'detail-group', b'movie-link') if isinstance(html, bytes) else ('detail-group', 'movie-link')
+    if not any(marker in html for marker in markers):
+        return metadata
     
-    LIST_FIELDS = {
-        'tags', 'genre', 'director', 'cinematographer', 'actors', 'color',
-        'shot_type', 'lens_size', 'composition', 'lighting', 'lighting_type',
-        'set', 'story_location', 'filming_location', 'editor', 'colorist',
-        'production_designer', 'costume_designer', 'music_genre', 'video_genre',
-        'stylist', 'production_company',
-    }
+    tree = LexborHTMLParser(html)
     
-    for detail_group in soup.find_all('div', class_='detail-group'):
-        label_elem = detail_group.find('p', class_='detail-type')
+    for detail_group in tree.css('div.detail-group'):
+        label_elem = detail_group.css_first('p.detail-type')
         if not label_elem:
             continue
         
-        label_text = label_elem.get_text(strip=True).rstrip(':').lower()
-        if label_text not in FIELD_NAMES:
+        field_name = FIELD_NAMES.get(normalize_label(label_elem.text(strip=True)))
+        if field_name is None:
             continue
         
-        field_name = FIELD_NAMES[label_text]
-        values_elem = detail_group.find('div', class_='details')
+        values_elem = detail_group.css_first('div.details')
         if not values_elem:
             continue
         
-        links = values_elem.find_all('a')
+        links = values_elem.css('a')
         if links:
-            values = [link.get_text(strip=True) for link in links if link.get_text(strip=True)]
+            values = [value for value in (link.text(strip=True) for link in links) if value]
         else:
-            text = values_elem.get_text(strip=True)
+            text = values_elem.text(strip=True)
             values = [v.strip() for v in text.split(',') if v.strip()] if ',' in text else [text] if text else []
         
         if values:
@@ -342,26 +506,57 @@ def parse_metadata_html(html: str, shot_id: str) -> dict:
     
     # Look for title in other places
     if 'title' not in metadata:
-        title_link = soup.find('a', class_='movie-link')
+        title_link = tree.css_first('a.movie-link')
         if title_link:
-            metadata['title'] = title_link.get_text(strip=True)
+            metadata['title'] = title_link.text(strip=True)
     
     return metadata
 
 
-def fetch_metadata(session: requests.Session, shot_id: str) -> dict | None:
-    """Fetch metadata for a single shot."""
+def fetch_metadata(session: requests.Session, shot_id: str, parse_pool: Executor | None = None) -> dict | None:
+    """
+    Fetch metadata for a single shot.
+    
+    If parse_pool is given (e.g. a ProcessPoolExecutor), the page is parsed
+    there so parsing runs outside this thread and isn't held by the GIL.
+    """
     url = f"{METADATA_BASE_URL}/{shot_id}/"
+    META_BUCKET.acquire()
     
     try:
         response = session.get(url, headers=HEADERS, timeout=30)
         if response.status_code == 200:
-            return parse_metadata_html(response.text, shot_id)
+            html = response_html(response)
+            if parse_pool is not None:
+                try:
+                    return parse_pool.submit(parse_metadata_html, html, shot_id).result()
+                except BrokenProcessPool:
+                    # A parse worker died (e.g. killed for memory); parse here instead
+                    pass
+            return parse_metadata_html(html, shot_id)
         return None
     except requests.RequestException:
         return None
 
 
+def open_metadata_cache(path: str) -> sqlite3.Connection:
+    """Open the on-disk metadata cache, creating it if needed."""
+    db = sqlite3.connect(path)
+    db.execute('CREATE TABLE IF NOT EXISTS meta (id TEXT PRIMARY KEY, blob BLOB)')
+    return db
+
+
+def load_cached_metadata(db: sqlite3.Connection, shot_id: str) -> dict | None:
+    """Return metadata saved by an earlier run, or None."""
+    row = db.execute('SELECT blob FROM meta WHERE id = ?', (shot_id,)).fetchone()
+    return orjson.loads(row[0]) if row else None
+
+
+def store_metadata(db: sqlite3.Connection, shot_id: str, metadata: dict):
+    """Save metadata for a shot so later runs can skip fetching it."""
+    db.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (shot_id, orjson.dumps(metadata)))
+
+
 # =============================================================================
 # GROUPING AND OUTPUT
 # =============================================================================
@@ -394,23 +589,24 @@ def get_title_key(metadata: dict) -> str:
 
 def group_by_title(all_metadata: list[dict]) -> dict:
     """Group shots by their title."""
-    groups = defaultdict(lambda: {
-        "metadata": {},
-        "video_count": 0,
-        "total_size_mb": 0,
-        "shots": []
-    })
+    groups = {}
+    group_bytes = defaultdict(int)
     
     for item in all_metadata:
         title_key = get_title_key(item)
-        group = groups[title_key]
+        group = groups.get(title_key)
         
-        if not group["metadata"]:
-            group["metadata"] = {
-                "director": item.get('director', []),
-                "cinematographer": item.get('cinematographer', []),
-                "genre": item.get('genre', []),
-                "year": item.get('year') or item.get('time_period'),
+        if group is None:
+            group = groups[title_key] = {
+                "metadata": {
+                    "director": item.get('director', []),
+                    "cinematographer": item.get('cinematographer', []),
+                    "genre": item.get('genre', []),
+                    "year": item.get('year') or item.get('time_period'),
+                },
+                "video_count": 0,
+                "total_size_mb": 0,
+                "shots": [],
             }
         
         shot_info = {
@@ -425,12 +621,24 @@ def group_by_title(all_metadata: list[dict]) -> dict:
         group["shots"].append(shot_info)
         group["video_count"] += 1
         if item.get('size_bytes'):
-            group["total_size_mb"] += item['size_bytes'] / (1024 * 1024)
+            group_bytes[title_key] += item['size_bytes']
     
-    for group in groups.values():
-        group["total_size_mb"] = round(group["total_size_mb"], 2)
+    # Sizes are summed as integer bytes and converted to MB once per group
+    for title_key, group in groups.items():
+        group["total_size_mb"] = round(group_bytes[title_key] / (1024 * 1024), 2)
     
-    return dict(groups)
+    return groups
+
+
+def write_output(path: str, payload: bytes):
+    """Write serialized output straight to a file descriptor, without Python's buffered I/O."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 # =============================================================================
@@ -457,63 +665,120 @@ def main():
     session = requests.Session()
     session.cookies.update(COOKIES)
     
+    # Keep CDN connections alive across downloads instead of reconnecting per file
+    adapter = HTTPAdapter(
+        pool_connections=VIDEO_DOWNLOAD_WORKERS,
+        pool_maxsize=VIDEO_DOWNLOAD_WORKERS * 4,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount('https://', adapter)
+    
     # Track timing
-    total_start = datetime.now()
+    total_start = time.perf_counter()
     
     # Step 1: Discover shots via API
     print("\n[STEP 1] Discovering shots via API")
     print("-" * 40)
-    api_start = datetime.now()
+    api_start = time.perf_counter()
     shot_ids, api_stats = scrape_api_shots(session, limit=N_VIDEOS)
-    api_time = (datetime.now() - api_start).total_seconds()
+    api_time = time.perf_counter() - api_start
     
     if not shot_ids:
         print("No shots found!")
         return
     
-    # Step 2: Fetch metadata
-    print(f"\n[STEP 2] Fetching metadata for {len(shot_ids)} shots")
-    print("-" * 40)
-    metadata_start = datetime.now()
-    all_metadata = []
-    
-    for i, shot_id in enumerate(shot_ids, 1):
-        metadata = fetch_metadata(session, shot_id)
-        if metadata:
-            all_metadata.append(metadata)
-        else:
-            all_metadata.append({"shot_id": shot_id})
-        
-        if i % 100 == 0:
-            print(f"  {i}/{len(shot_ids)} metadata fetched")
-        
-        time.sleep(METADATA_DELAY)
-    
-    metadata_time = (datetime.now() - metadata_start).total_seconds()
-    print(f"  Metadata fetched: {len(all_metadata)}")
+    # Request clips in ID order so neighbouring IDs reuse the same CDN
+    # connections and cache shards back to back
+    shot_ids.sort()
     
-    # Step 3: Download videos
-    print(f"\n[STEP 3] Downloading videos")
+    # Step 2: Fetch metadata and download videos concurrently
+    print(f"\n[STEP 2] Fetching metadata and downloading videos for {len(shot_ids)} shots")
     print("-" * 40)
-    download_start = datetime.now()
-    download_results = []
-    
-    with ThreadPoolExecutor(max_workers=VIDEO_DOWNLOAD_WORKERS) as executor:
-        futures = {
-            executor.submit(download_video, shot_id, VIDEO_DIR, session): shot_id
-            for shot_id in shot_ids
-        }
-        
-        completed = 0
-        for future in as_completed(futures):
-            result = future.result()
-            download_results.append(result)
-            completed += 1
+    pipeline_start = time.perf_counter()
+    metadata_time = download_time = 0.0
+    
+    # Reuse metadata from earlier runs and skip clips that are already on disk
+    metadata_cache = open_metadata_cache(os.path.join(OUTPUT_DIR, "metadata.sqlite"))
+    cache_writes = 0
+    existing = {
+        name[:-len("_clip.mp4")] for name in os.listdir(VIDEO_DIR)
+        if name.endswith("_clip.mp4")
+    }
+    metadata_map = {}
+    for shot_id in shot_ids:
+        cached = load_cached_metadata(metadata_cache, shot_id)
+        # Rows holding only the shot ID (e.g. from a login redirect) are refetched
+        if cached and len(cached) > 1:
+            metadata_map[shot_id] = cached
+    download_results = [
+        download_video(shot_id, VIDEO_DIR, session) for shot_id in shot_ids if shot_id in existing
+    ]
+    print(f"  Cached metadata: {len(metadata_map)}, videos on disk: {len(download_results)}")
+    
+    # One pool shared by both stages. Each shot's download is queued once its
+    # metadata arrives, and per-stage caps keep the metadata host and the CDN
+    # at METADATA_WORKERS and VIDEO_DOWNLOAD_WORKERS concurrent requests.
+    pending_metadata = deque(shot_id for shot_id in shot_ids if shot_id not in metadata_map)
+    pending_downloads = deque(shot_id for shot_id in metadata_map if shot_id not in existing)
+    in_flight = {}
+    metadata_running = downloads_running = 0
+    
+    # Network I/O stays on threads; HTML parsing goes to worker processes.
+    # Workers are spawned rather than forked, since they start from a pool
+    # thread while other threads hold locks mid-request.
+    with (
+        ProcessPoolExecutor(
+            max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context('spawn')
+        ) as parse_pool,
+        ThreadPoolExecutor(max_workers=METADATA_WORKERS + VIDEO_DOWNLOAD_WORKERS) as executor,
+    ):
+        while pending_metadata or pending_downloads or in_flight:
+            while pending_metadata and metadata_running < METADATA_WORKERS:
+                shot_id = pending_metadata.popleft()
+                in_flight[executor.submit(fetch_metadata, session, shot_id, parse_pool)] = ("metadata", shot_id)
+                metadata_running += 1
+            
+            while pending_downloads and downloads_running < VIDEO_DOWNLOAD_WORKERS:
+                shot_id = pending_downloads.popleft()
+                in_flight[executor.submit(download_video, shot_id, VIDEO_DIR, session)] = ("download", shot_id)
+                downloads_running += 1
+            
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            elapsed = time.perf_counter() - pipeline_start
             
-            if completed % 100 == 0:
-                print(f"  {completed}/{len(shot_ids)} videos processed")
+            for future in done:
+                stage, shot_id = in_flight.pop(future)
+                
+                if stage == "metadata":
+                    metadata_running -= 1
+                    metadata = future.result()
+                    metadata_map[shot_id] = metadata or {"shot_id": shot_id}
+                    
+                    # Only pages that yielded metadata are cached; failures and
+                    # empty pages (e.g. an expired session) are retried next run
+                    if metadata and len(metadata) > 1:
+                        store_metadata(metadata_cache, shot_id, metadata)
+                        cache_writes += 1
+                        if cache_writes % METADATA_CACHE_COMMIT_EVERY == 0:
+                            metadata_cache.commit()
+                    
+                    if shot_id not in existing:
+                        pending_downloads.append(shot_id)
+                    metadata_time = elapsed
+                    if len(metadata_map) % 100 == 0:
+                        print(f"  {len(metadata_map)}/{len(shot_ids)} metadata fetched")
+                else:
+                    downloads_running -= 1
+                    download_results.append(future.result())
+                    download_time = elapsed
+                    if len(download_results) % 100 == 0:
+                        print(f"  {len(download_results)}/{len(shot_ids)} videos processed")
+    
+    all_metadata = [metadata_map[shot_id] for shot_id in shot_ids]
+    print(f"  Metadata fetched: {len(all_metadata)}")
     
-    download_time = (datetime.now() - download_start).total_seconds()
+    metadata_cache.commit()
+    metadata_cache.close()
     
     # Merge download info with metadata
     download_map = {r['shot_id']: r for r in download_results}
@@ -524,13 +789,13 @@ def main():
         if dl.get('size_bytes'):
             item['size_bytes'] = dl['size_bytes']
     
-    # Step 4: Group and save
-    print(f"\n[STEP 4] Grouping and saving results")
+    # Step 3: Group and save
+    print(f"\n[STEP 3] Grouping and saving results")
     print("-" * 40)
     grouped_data = group_by_title(all_metadata)
     
     # Calculate stats
-    total_time = (datetime.now() - total_start).total_seconds()
+    total_time = time.perf_counter() - total_start
     downloaded_count = sum(1 for r in download_results if r.get('status') in ['downloaded', 'exists'])
     failed_count = sum(1 for r in download_results if r.get('status') == 'failed')
     total_size = sum(r.get('size_bytes', 0) for r in download_results if r.get('size_bytes'))
@@ -561,8 +826,7 @@ def main():
     }
     
     output_path = os.path.join(OUTPUT_DIR, "shotdeck_grouped.json")
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    write_output(output_path, orjson.dumps(output, option=orjson.OPT_INDENT_2))
     
     # Print summary
     print(f"\n{'=' * 60}")
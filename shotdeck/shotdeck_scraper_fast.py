@@ -28,7 +28,7 @@ Limitations:
 
 Requirements:
 - Python 3.10+
-- requests, beautifulsoup4
+- requests, beautifulsoup4, lxml, orjson, selectolax
 - ShotDeck account with valid session cookie (for metadata)
 
 Usage:
@@ -36,14 +36,23 @@ Usage:
 """
 
 import requests
-import json
+import orjson
 import os
+import functools
 import time
 import re
+import shutil
+import sqlite3
+import threading
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
 from bs4 import BeautifulSoup
+from tqdm import tqdm
+from selectolax.lexbor import LexborHTMLParser
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
 
 
 # =============================================================================
@@ -56,8 +65,16 @@ OUTPUT_DIR = os.path.join(SCRIPT_DIR, "output")
 VIDEO_DIR = os.path.join(OUTPUT_DIR, "videos")
 
 # Rate limiting
-METADATA_DELAY = 0.3     # Seconds between metadata requests
-VIDEO_DOWNLOAD_WORKERS = 5  # Parallel video downloads (can be higher since all exist)
+METADATA_DELAY = 0.3     # Average seconds between metadata requests (all workers)
+METADATA_BURST = 8       # Metadata requests allowed back to back
+METADATA_WORKERS = 4     # Parallel metadata requests
+METADATA_CACHE_COMMIT_EVERY = 100  # Cached metadata rows written per commit
+# CPUs this process may run on (sched_getaffinity is Linux-only)
+CPU_COUNT = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count() or 1
+# Parallel video downloads. Downloads are I/O bound, so this scales well past
+# the CPU count; set the VIDEO_DOWNLOAD_WORKERS environment variable to tune
+VIDEO_DOWNLOAD_WORKERS = int(os.environ.get('VIDEO_DOWNLOAD_WORKERS', 0)) or max(32, 4 * CPU_COUNT)
+DOWNLOAD_CHUNK_SIZE = 256 * 1024  # Bytes copied per read when saving videos
 
 # URLs
 CDN_DIRECTORY_URL = "https://crunch.shotdeck.com/assets/images/clips/"
@@ -81,10 +98,52 @@ HEADERS = {
 }
 
 
+# =============================================================================
+# RATE LIMITING
+# =============================================================================
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    
+    Allows bursts of up to `capacity` requests and refills at `rate` tokens
+    per second, so throughput is capped on average rather than by a fixed
+    sleep after every request.
+    """
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.condition = threading.Condition()
+    
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        with self.condition:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                self.condition.wait((1 - self.tokens) / self.rate)
+
+
+META_BUCKET = TokenBucket(rate=1 / METADATA_DELAY, capacity=METADATA_BURST)
+
+
 # =============================================================================
 # CDN DIRECTORY SCRAPING
 # =============================================================================
 
+# Clip filenames in the directory listing: XXXXXXXX_clip.mp4
+CLIP_FILENAME_RE = re.compile(r'^([A-Z0-9]{8})_clip\.mp4$')
+
+
 def scrape_cdn_directory(limit: int = None) -> list[str]:
     """
     Scrape clip IDs from the CDN directory listing.
@@ -102,13 +161,12 @@ def scrape_cdn_directory(limit: int = None) -> list[str]:
         response = requests.get(CDN_DIRECTORY_URL, headers=HEADERS, timeout=60)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.text, 'lxml')
         
         clip_ids = set()
         for link in soup.find_all('a', href=True):
             href = link['href']
-            # Match pattern: XXXXXXXX_clip.mp4
-            match = re.match(r'^([A-Z0-9]{8})_clip\.mp4$', href)
+            match = CLIP_FILENAME_RE.match(href)
             if match:
                 clip_ids.add(match.group(1))
         
@@ -130,7 +188,7 @@ def scrape_cdn_directory(limit: int = None) -> list[str]:
 # VIDEO DOWNLOAD
 # =============================================================================
 
-def download_video(shot_id: str, output_dir: str) -> dict:
+def download_video(shot_id: str, output_dir: str, session: requests.Session) -> dict:
     """
     Download a video clip from the CDN.
     
@@ -145,18 +203,40 @@ def download_video(shot_id: str, output_dir: str) -> dict:
         return {"shot_id": shot_id, "path": filepath, "size_bytes": size, "status": "exists"}
     
     try:
-        response = requests.get(url, stream=True, timeout=60)
-        
-        if response.status_code == 200:
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+        # Close the streamed response so its connection goes back to the pool
+        with session.get(url, stream=True, timeout=60) as response:
+            if response.status_code != 200:
+                return {"shot_id": shot_id, "status": "failed", "error": f"HTTP {response.status_code}"}
             
-            size = os.path.getsize(filepath)
-            return {"shot_id": shot_id, "path": filepath, "size_bytes": size, "status": "downloaded"}
-        else:
-            return {"shot_id": shot_id, "status": "failed", "error": f"HTTP {response.status_code}"}
-    except requests.RequestException as e:
+            with open(filepath, 'wb') as f:
+                # Reserve the whole file up front so it isn't grown chunk by chunk.
+                # Encoded bodies are skipped: their length is measured before decoding
+                expected_size = 0
+                if 'Content-Encoding' not in response.headers:
+                    expected_size = int(response.headers.get('Content-Length') or 0)
+                if expected_size and hasattr(os, 'posix_fallocate'):
+                    try:
+                        os.posix_fallocate(f.fileno(), 0, expected_size)
+                    except OSError:
+                        pass
+                
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+                
+                # Older urllib3 doesn't enforce Content-Length, so a short body
+                # would leave the preallocated tail zero-filled
+                written = f.tell()
+                if expected_size and written != expected_size:
+                    raise requests.RequestException(
+                        f"Incomplete download: {written} of {expected_size} bytes"
+                    )
+        
+        size = os.path.getsize(filepath)
+        return {"shot_id": shot_id, "path": filepath, "size_bytes": size, "status": "downloaded"}
+    except (requests.RequestException, Urllib3HTTPError) as e:
+        # Don't leave a partial file behind to be mistaken for a finished download
+        if os.path.exists(filepath):
+            os.remove(filepath)
         return {"shot_id": shot_id, "status": "failed", "error": str(e)}
 
 
@@ -164,45 +244,72 @@ def download_video(shot_id: str, output_dir: str) -> dict:
 # METADATA EXTRACTION
 # =============================================================================
 
-def parse_metadata_html(html: str, shot_id: str) -> dict:
+# Detail labels (lower-cased, without trailing colon) mapped to output fields
+FIELD_NAMES = {
+    'tag': 'tags', 'tags': 'tags',
+    'genre': 'genre', 'genres': 'genre',
+    'director': 'director', 'directors': 'director',
+    'cinematographer': 'cinematographer',
+    'actors': 'actors', 'actor': 'actors', 'cast': 'actors',
+    'year': 'year',
+    'time period': 'time_period',
+    'title': 'title', 'movie': 'title', 'film': 'title',
+    'music genre': 'music_genre',
+    'video genre': 'video_genre',
+}
+
+# Fields that are always stored as lists
+LIST_FIELDS = frozenset({'tags', 'genre', 'director', 'cinematographer', 'actors', 'music_genre', 'video_genre'})
+
+
+@functools.lru_cache(maxsize=256)
+def normalize_label(label: str) -> str:
+    """Normalize a detail label ("Director:" -> "director"); labels repeat across pages."""
+    return label.rstrip(':').lower()
+
+
+def response_html(response: requests.Response) -> bytes | str:
+    """
+    Return a page body in the form the parser should receive.
+    
+    Lexbor always decodes bytes as UTF-8, so raw bytes are only handed over
+    when the response is UTF-8; other charsets are decoded by requests.
+    """
+    if (response.encoding or '').lower().replace('_', '-') in ('utf-8', 'utf8'):
+        return response.content
+    return response.text
+
+
+def parse_metadata_html(html: bytes | str, shot_id: str) -> dict:
     """Parse metadata from ShotDeck's AJAX response."""
-    soup = BeautifulSoup(html, 'html.parser')
     metadata = {"shot_id": shot_id}
     
-    FIELD_NAMES = {
-        'tag': 'tags', 'tags': 'tags',
-        'genre': 'genre', 'genres': 'genre',
-        'director': 'director', 'directors': 'director',
-        'cinematographer': 'cinematographer',
-        'actors': 'actors', 'actor': 'actors', 'cast': 'actors',
-        'year': 'year',
-        'time period': 'time_period',
-        'title': 'title', 'movie': 'title', 'film': 'title',
-        'music genre': 'music_genre',
-        'video genre': 'video_genre',
-    }
+    # A plain substring scan rules out pages with nothing to extract (e.g.
+    # login redirects) without building a tree
+    markers = (b'detail-group', b'movie-link') if isinstance(html, bytes) else ('detail-group', 'movie-link')
+    if not any(marker in html for marker in markers):
+        return metadata
     
-    LIST_FIELDS = {'tags', 'genre', 'director', 'cinematographer', 'actors', 'music_genre', 'video_genre'}
+    tree = LexborHTMLParser(html)
     
-    for detail_group in soup.find_all('div', class_='detail-group'):
-        label_elem = detail_group.find('p', class_='detail-type')
+    for detail_group in tree.css('div.detail-group'):
+        label_elem = detail_group.css_first('p.detail-type')
         if not label_elem:
             continue
         
-        label_text = label_elem.get_text(strip=True).rstrip(':').lower()
-        if label_text not in FIELD_NAMES:
+        field_name = FIELD_NAMES.get(normalize_label(label_elem.text(strip=True)))
+        if field_name is None:
             continue
         
-        field_name = FIELD_NAMES[label_text]
-        values_elem = detail_group.find('div', class_='details')
+        values_elem = detail_group.css_first('div.details')
         if not values_elem:
             continue
         
-        links = values_elem.find_all('a')
+        links = values_elem.css('a')
         if links:
-            values = [link.get_text(strip=True) for link in links if link.get_text(strip=True)]
+            values = [value for value in (link.text(strip=True) for link in links) if value]
         else:
-            text = values_elem.get_text(strip=True)
+            text = values_elem.text(strip=True)
             values = [v.strip() for v in text.split(',') if v.strip()] if ',' in text else [text] if text else []
         
         if values:
@@ -212,9 +319,9 @@ def parse_metadata_html(html: str, shot_id: str) -> dict:
                 metadata[field_name] = values[0] if len(values) == 1 else values
     
     if 'title' not in metadata:
-        title_link = soup.find('a', class_='movie-link')
+        title_link = tree.css_first('a.movie-link')
         if title_link:
-            metadata['title'] = title_link.get_text(strip=True)
+            metadata['title'] = title_link.text(strip=True)
     
     return metadata
 
@@ -222,81 +329,135 @@ def parse_metadata_html(html: str, shot_id: str) -> dict:
 def fetch_metadata(session: requests.Session, shot_id: str) -> dict | None:
     """Fetch metadata for a single shot."""
     url = f"{METADATA_BASE_URL}/{shot_id}/"
+    META_BUCKET.acquire()
     
     try:
         response = session.get(url, headers=HEADERS, timeout=30)
         if response.status_code == 200:
-            return parse_metadata_html(response.text, shot_id)
+            return parse_metadata_html(response_html(response), shot_id)
         return None
     except requests.RequestException:
         return None
 
 
+def open_metadata_cache(path: str) -> sqlite3.Connection:
+    """Open the on-disk metadata cache, creating it if needed."""
+    db = sqlite3.connect(path)
+    db.execute('CREATE TABLE IF NOT EXISTS meta (id TEXT PRIMARY KEY, blob BLOB)')
+    return db
+
+
+def load_cached_metadata(db: sqlite3.Connection, shot_id: str) -> dict | None:
+    """Return metadata saved by an earlier run, or None."""
+    row = db.execute('SELECT blob FROM meta WHERE id = ?', (shot_id,)).fetchone()
+    return orjson.loads(row[0]) if row else None
+
+
+def store_metadata(db: sqlite3.Connection, shot_id: str, metadata: dict):
+    """Save metadata for a shot so later runs can skip fetching it."""
+    db.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (shot_id, orjson.dumps(metadata)))
+
+
 # =============================================================================
 # GROUPING AND OUTPUT
 # =============================================================================
 
+# Keys that are not copied from a metadata item into its shot entry
+EXCLUDED_SHOT_KEYS = frozenset({'shot_id'})
+
+
+def as_list(value) -> list:
+    """Normalize a metadata field that may be a single value or a list."""
+    if isinstance(value, list):
+        return value
+    return [value] if value else []
+
+
 def get_title_key(metadata: dict) -> str:
     """Generate a grouping key from metadata."""
-    if metadata.get('title'):
-        return metadata['title']
-    
-    artists = metadata.get('actors', [])
-    if isinstance(artists, str):
-        artists = [artists]
-    
-    year = metadata.get('year') or metadata.get('time_period')
-    
-    if artists:
-        title_parts = [', '.join(artists)]
-        if year:
-            title_parts.append(f"({year})")
-        return ' '.join(title_parts)
-    
-    directors = metadata.get('director', [])
-    if isinstance(directors, str):
-        directors = [directors]
-    if directors:
-        return ', '.join(directors)
+    title_key = metadata.get('title')
+    if not title_key:
+        artists = as_list(metadata.get('actors'))
+        if artists:
+            year = metadata.get('year') or metadata.get('time_period')
+            title_key = f"{', '.join(artists)} ({year})" if year else ', '.join(artists)
+        else:
+            title_key = ', '.join(as_list(metadata.get('director'))) or "Unknown"
     
-    return "Unknown"
+    return title_key
 
 
-def group_by_title(all_metadata: list[dict]) -> dict:
-    """Group shots by their title."""
-    groups = defaultdict(lambda: {
-        "metadata": {},
-        "video_count": 0,
-        "total_size_mb": 0,
-        "shots": []
-    })
+def group_by_title(all_metadata: list[dict], download_results: list[dict]) -> dict:
+    """
+    Group shots by title, adding each shot's download info to its entry.
+    
+    Both lists must be in the same order, so they can be walked together in
+    a single pass. Group sizes are summed as integer bytes; write_output
+    converts them to MB.
+    """
+    groups = {}
     
-    for item in all_metadata:
+    for item, dl in zip(all_metadata, download_results):
         title_key = get_title_key(item)
-        group = groups[title_key]
+        group = groups.get(title_key)
         
-        if not group["metadata"]:
-            group["metadata"] = {
-                "director": item.get('director', []),
-                "cinematographer": item.get('cinematographer', []),
-                "genre": item.get('genre', []),
-                "year": item.get('year') or item.get('time_period'),
+        if group is None:
+            group = groups[title_key] = {
+                "metadata": {
+                    "director": item.get('director', []),
+                    "cinematographer": item.get('cinematographer', []),
+                    "genre": item.get('genre', []),
+                    "year": item.get('year') or item.get('time_period'),
+                },
+                "video_count": 0,
+                "size_bytes": 0,
+                "shots": [],
             }
         
         shot_info = {"shot_id": item.get('shot_id')}
-        for key, value in item.items():
-            if key not in ['shot_id'] and value:
-                shot_info[key] = value
+        shot_info.update({
+            key: value for key, value in item.items()
+            if value and key not in EXCLUDED_SHOT_KEYS
+        })
+        # Download info goes on the shot entry; the metadata items are left untouched
+        if dl.get('path'):
+            shot_info['local_path'] = dl['path']
+        if dl.get('size_bytes'):
+            shot_info['size_bytes'] = dl['size_bytes']
+            group["size_bytes"] += dl['size_bytes']
         
         group["shots"].append(shot_info)
         group["video_count"] += 1
-        if item.get('size_bytes'):
-            group["total_size_mb"] += item['size_bytes'] / (1024 * 1024)
     
-    for group in groups.values():
-        group["total_size_mb"] = round(group["total_size_mb"], 2)
+    return groups
+
+
+def write_output(path: str, header: dict, groups: dict):
+    """
+    Stream the output JSON to disk one group at a time.
     
-    return dict(groups)
+    Only a single group is serialized in memory at once, instead of the
+    whole document.
+    """
+    with open(path, 'wb') as f:
+        if not groups:
+            f.write(orjson.dumps({**header, "groups": {}}, option=orjson.OPT_INDENT_2))
+            return
+        
+        # Reopen the header object so the groups can be appended to it. The
+        # layout matches a single indented dump: orjson escapes newlines
+        # inside strings, so every raw newline in a group is structural
+        f.write(orjson.dumps(header, option=orjson.OPT_INDENT_2)[:-2] + b',\n  "groups": {')
+        for i, (title_key, group) in enumerate(groups.items()):
+            group_out = {
+                "metadata": group["metadata"],
+                "video_count": group["video_count"],
+                "total_size_mb": round(group["size_bytes"] / (1024 * 1024), 2),
+                "shots": group["shots"],
+            }
+            group_json = orjson.dumps(group_out, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n    ')
+            f.write((b',\n    ' if i else b'\n    ') + orjson.dumps(title_key) + b': ' + group_json)
+        f.write(b'\n  }\n}')
 
 
 # =============================================================================
@@ -323,15 +484,28 @@ def main():
     if cookies_valid:
         session.cookies.update(COOKIES)
     
+    # Keep connections alive across requests instead of reconnecting per file.
+    # One pooled socket per worker; pool_block makes extra threads wait for a
+    # free connection rather than opening throwaway ones.
+    pool_size = max(VIDEO_DOWNLOAD_WORKERS, METADATA_WORKERS)
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        pool_block=True,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    
     # Track timing
-    total_start = datetime.now()
+    total_start = time.perf_counter()
     
     # Step 1: Get clip IDs from CDN directory
     print("\n[STEP 1] Scraping CDN directory")
     print("-" * 40)
-    discovery_start = datetime.now()
+    discovery_start = time.perf_counter()
     clip_ids = scrape_cdn_directory(limit=N_VIDEOS)
-    discovery_time = (datetime.now() - discovery_start).total_seconds()
+    discovery_time = time.perf_counter() - discovery_start
     
     if not clip_ids:
         print("No clips found!")
@@ -340,69 +514,102 @@ def main():
     # Step 2: Download videos in parallel
     print(f"\n[STEP 2] Downloading {len(clip_ids)} videos")
     print("-" * 40)
-    download_start = datetime.now()
-    download_results = []
+    download_start = time.perf_counter()
     
-    with ThreadPoolExecutor(max_workers=VIDEO_DOWNLOAD_WORKERS) as executor:
+    # Clips already on disk are recorded up front instead of taking a worker
+    existing = {
+        name[:-len("_clip.mp4")] for name in os.listdir(VIDEO_DIR)
+        if name.endswith("_clip.mp4")
+    }
+    # Results are stored by position so they line up with clip_ids
+    download_results = [None] * len(clip_ids)
+    for i, clip_id in enumerate(clip_ids):
+        if clip_id in existing:
+            download_results[i] = download_video(clip_id, VIDEO_DIR, session)
+    
+    pending = download_results.count(None)
+    download_workers = max(1, min(pending, VIDEO_DOWNLOAD_WORKERS))
+    print(f"  Already on disk: {len(clip_ids) - pending}")
+    print(f"  Download workers: {download_workers}")
+    
+    with ThreadPoolExecutor(max_workers=download_workers) as executor:
         futures = {
-            executor.submit(download_video, clip_id, VIDEO_DIR): clip_id
-            for clip_id in clip_ids
+            executor.submit(download_video, clip_id, VIDEO_DIR, session): i
+            for i, clip_id in enumerate(clip_ids) if clip_id not in existing
         }
         
-        completed = 0
-        for future in as_completed(futures):
-            result = future.result()
-            download_results.append(result)
-            completed += 1
-            
-            if completed % 100 == 0:
-                print(f"  {completed}/{len(clip_ids)} videos processed")
+        # tqdm throttles its own redraws, so progress costs no per-item stdout writes
+        progress = tqdm(
+            as_completed(futures), total=len(futures), desc="  Videos", mininterval=0.5
+        )
+        for future in progress:
+            download_results[futures[future]] = future.result()
     
-    download_time = (datetime.now() - download_start).total_seconds()
+    download_time = time.perf_counter() - download_start
     
     # Step 3: Fetch metadata
     print(f"\n[STEP 3] Fetching metadata")
     print("-" * 40)
-    metadata_start = datetime.now()
-    all_metadata = []
+    metadata_start = time.perf_counter()
     
     if cookies_valid:
-        for i, clip_id in enumerate(clip_ids, 1):
-            metadata = fetch_metadata(session, clip_id)
-            if metadata:
-                all_metadata.append(metadata)
-            else:
-                all_metadata.append({"shot_id": clip_id})
-            
-            if i % 100 == 0:
-                print(f"  {i}/{len(clip_ids)} metadata fetched")
+        # Kept apart from the comprehensive scraper's cache, which stores more fields
+        metadata_cache = open_metadata_cache(os.path.join(OUTPUT_DIR, "metadata_fast.sqlite"))
+        cache_writes = 0
+        metadata_map = {}
+        for clip_id in clip_ids:
+            cached = load_cached_metadata(metadata_cache, clip_id)
+            # Rows holding only the shot ID (e.g. from a login redirect) are refetched
+            if cached and len(cached) > 1:
+                metadata_map[clip_id] = cached
+        print(f"  Cached metadata: {len(metadata_map)}")
+        
+        with ThreadPoolExecutor(max_workers=METADATA_WORKERS) as executor:
+            futures = {
+                executor.submit(fetch_metadata, session, clip_id): clip_id
+                for clip_id in clip_ids if clip_id not in metadata_map
+            }
             
-            time.sleep(METADATA_DELAY)
+            progress = tqdm(
+                as_completed(futures), total=len(futures), desc="  Metadata", mininterval=0.5
+            )
+            for future in progress:
+                clip_id = futures[future]
+                metadata = future.result()
+                # Only pages that yielded metadata are cached; failures and
+                # empty pages (e.g. an expired session) are retried next run
+                if metadata and len(metadata) > 1:
+                    store_metadata(metadata_cache, clip_id, metadata)
+                    cache_writes += 1
+                    if cache_writes % METADATA_CACHE_COMMIT_EVERY == 0:
+                        metadata_cache.commit()
+                metadata_map[clip_id] = metadata or {"shot_id": clip_id}
+        
+        metadata_cache.commit()
+        metadata_cache.close()
+        all_metadata = [metadata_map[clip_id] for clip_id in clip_ids]
     else:
         all_metadata = [{"shot_id": clip_id} for clip_id in clip_ids]
         print("  Skipped (no session cookie)")
     
-    metadata_time = (datetime.now() - metadata_start).total_seconds()
-    
-    # Merge download info with metadata
-    download_map = {r['shot_id']: r for r in download_results}
-    for item in all_metadata:
-        dl = download_map.get(item['shot_id'], {})
-        if dl.get('path'):
-            item['local_path'] = dl['path']
-        if dl.get('size_bytes'):
-            item['size_bytes'] = dl['size_bytes']
+    metadata_time = time.perf_counter() - metadata_start
     
     # Step 4: Group and save
     print(f"\n[STEP 4] Grouping and saving results")
     print("-" * 40)
-    grouped_data = group_by_title(all_metadata)
+    # Both lists follow clip_ids order
+    grouped_data = group_by_title(all_metadata, download_results)
     
     # Calculate stats
-    total_time = (datetime.now() - total_start).total_seconds()
-    downloaded_count = sum(1 for r in download_results if r.get('status') in ['downloaded', 'exists'])
-    failed_count = sum(1 for r in download_results if r.get('status') == 'failed')
-    total_size = sum(r.get('size_bytes', 0) for r in download_results if r.get('size_bytes'))
+    total_time = time.perf_counter() - total_start
+    statuses = Counter()
+    total_size = 0
+    for r in download_results:
+        statuses[r.get('status')] += 1
+        total_size += r.get('size_bytes') or 0
+    downloaded_count = statuses['downloaded'] + statuses['exists']
+    failed_count = statuses['failed']
+    total_mb = total_size / (1024 * 1024)
     
     # Save results
     output = {
@@ -413,7 +620,7 @@ def main():
             "videos_downloaded": downloaded_count,
             "videos_failed": failed_count,
             "metadata_retrieved": len([m for m in all_metadata if len(m) > 1]),
-            "total_size_mb": round(total_size / (1024 * 1024), 2),
+            "total_size_mb": round(total_mb, 2),
             "unique_groups": len(grouped_data),
             "timing": {
                 "discovery_seconds": round(discovery_time, 1),
@@ -423,15 +630,17 @@ def main():
             },
             "speed": {
                 "videos_per_second": round(downloaded_count / download_time, 3) if download_time > 0 else 0,
-                "mb_per_second": round((total_size / (1024 * 1024)) / download_time, 2) if download_time > 0 else 0,
+                "mb_per_second": round(total_mb / download_time, 2) if download_time > 0 else 0,
             }
         },
-        "groups": grouped_data
     }
     
     output_path = os.path.join(OUTPUT_DIR, "shotdeck_grouped.json")
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    # The file is written in the background while the summary prints; the
+    # summary only reads the stats header, which the writer never modifies
+    writer = ThreadPoolExecutor(max_workers=1)
+    write_future = writer.submit(write_output, output_path, output, grouped_data)
+    writer.shutdown(wait=False)
     
     # Print summary
     print(f"\n{'=' * 60}")
@@ -452,8 +661,11 @@ def main():
     print(f"  Videos/second: {output['stats']['speed']['videos_per_second']:.3f}")
     print(f"  MB/second: {output['stats']['speed']['mb_per_second']:.2f}")
     print()
-    print(f"Output: {output_path}")
     print(f"Videos: {VIDEO_DIR}/")
+    
+    # Re-raises any error from the writer, so a failed save fails the run
+    write_future.result()
+    print(f"Output: {output_path}")
 
 
 if __name__ == "__main__":